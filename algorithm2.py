@@ -1,8 +1,57 @@
 import heapq
-from collections import defaultdict
+import importlib.util
+import math
+from collections import OrderedDict
+from array import array
 from datetime import datetime
 from data import User, Post, Comment
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scoring falls back to pure Python
+    np = None
+
+# Numba is optional; NumPy handles vectorized scoring by default. Importing Numba and loading the
+# compiled kernel take a few tenths of a second, which only pays off on graphs of at least
+# _NUMBA_MIN_USERS users, so _score_kernel() imports it the first time such a graph is scored.
+# _HAS_NUMBA is cleared if that import fails.
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+_NUMBA_MIN_USERS = 5_000_000
+
+# Reading levels as numbers for averaging and scoring; unknown levels count as medium
+_READING_LEVELS = {"low": 1, "medium": 2, "high": 3}
+_READING_NAMES = {level: name for name, level in _READING_LEVELS.items()}
+_READING_DEFAULT = 2
+
+# Visualization colors
+_HIGHLIGHT_COLOR = "#FF6B6B"
+_USER_COLOR = "#4ECDC4"
+_POST_COLOR = "#45B7D1"
+_EDGE_COLOR = {"created": "#FF6B6B"}
+_DEFAULT_EDGE_COLOR = "#DDD"
+
+# User attributes indexed by value for equality filters
+_INDEXED_ATTRS = ("location", "gender", "age", "reading_level")
+
+# Preference settings as integer codes for the compiled scoring kernel
+_PREF_CODES = {"high": 1, "low": -1}
+
+# find_interesting_users_interactive ranks in fixed point when every weight in use is a multiple of
+# 1 / _SCORE_SCALE: scores are int32 counts of that unit until they are reported. Other weights,
+# or scores that could exceed _INT32_MAX, are scored in float instead. The choice depends only on the
+# criteria and the users, so every path (pure Python, NumPy, Numba) ranks the same way.
+_SCORE_SCALE = 10
+_INT32_MAX = 2 ** 31 - 1
+_SCORE_COLUMNS = ("post_count", "comment_count", "total_views", "reading_level_int")
+
+# Number of criteria dicts whose scores each graph keeps cached; the least recently used are evicted
+_SCORE_CACHE_SIZE = 8
+
+# Integer codes for edge relationships; unrecognized ones are stored as -1,
+# which decodes to the last name ("unknown")
+_REL_CODES = {"created": 0, "viewed": 1, "commented": 2}
+_REL_NAMES = ("created", "viewed", "commented", "unknown")
+
 """
 Author: Michaela Gillan
 
@@ -10,33 +59,103 @@ This algorithm determines "interesting" users based off various factors includin
 
 """
 
+# Node attribute records kept in SocialGraph.node_data. __slots__ keeps them small and makes
+# attribute reads cheap; values fixed by node type live on the class instead of every instance.
+class UserAttrs:
+    __slots__ = ("post_count", "total_views", "age", "gender", "location", "comment_count",
+                 "reading_level", "user_obj")
+    type = "user"
+    _base_color = _USER_COLOR  # Visualization defaults
+    _base_size = 8
+    
+    def __init__(self, post_count, total_views, age, gender, location, comment_count, reading_level, user_obj):
+        self.post_count = post_count
+        self.total_views = total_views
+        self.age = age
+        self.gender = gender
+        self.location = location
+        self.comment_count = comment_count
+        self.reading_level = reading_level
+        self.user_obj = user_obj  # Keep reference to original object
+
+class PostAttrs:
+    __slots__ = ("view_count", "comment_count", "reading_level", "post_obj")
+    type = "post"
+    _base_color = _POST_COLOR  # Visualization defaults
+    _base_size = 5
+    
+    def __init__(self, view_count, comment_count, reading_level, post_obj):
+        self.view_count = view_count
+        self.comment_count = comment_count
+        self.reading_level = reading_level
+        self.post_obj = post_obj
+
 # Social Graph implementation that works with data.py classes
 class SocialGraph:
     def __init__(self):
         self.users = {}  # Dictionary of User objects
         self.posts = {}  # Dictionary of Post objects
         self.node_data = {}  # For compatibility with original algorithm
-        self.adjacency_list = defaultdict(list)
+        # Edges as aligned flat arrays: source id, target id, relationship code
+        self._edge_src = []
+        self._edge_tgt = []
+        self._edge_rel_code = array("b")
+        # Per-user rows kept as parallel lists (Struct-of-Arrays), appended in add_user and
+        # turned into NumPy columns on demand
+        self._usernames = []
+        self._post_count = []
+        self._total_views = []
+        self._comment_count = []
+        self._reading_int = []
+        self._age = []
+        self._gender = []
+        self._location = []
+        self._username_index = {}  # username -> row
+        self._user_columns = None  # NumPy columns built from the lists above
+        self._attr_index = {attr: {} for attr in _INDEXED_ATTRS}  # attr -> value -> [user ids]
+        # criteria key -> (NumPy scores, scale), or ({user_id: score}, scorer, scale) on the
+        # pure-Python path, least recently used first
+        self._score_cache = OrderedDict()
+        self._reading_by_post = {}  # post id -> estimated reading level as an int (1-3)
+        
+        # Compressed sparse row (CSR) copy of the edges grouped by source, built by finalize()
+        self.node_ids = []  # CSR index -> node id
+        self.indptr = None  # Edges of node i are targets[indptr[i]:indptr[i + 1]]
+        self.targets = None
+        self.rel_codes = None
+        self._csr_stale = True
     
     def add_user(self, user_obj):
         """Add a User object to the graph"""
         self.users[user_obj.username] = user_obj
         
+        # Drop a re-added user from the attribute index before indexing the new values
+        old_data = self.node_data.get(user_obj.username)
+        if old_data is not None and old_data.type == "user":
+            for attr, buckets in self._attr_index.items():
+                buckets[getattr(old_data, attr)].remove(user_obj.username)
+        
         # Calculate metrics for the user
         user_metrics = self._calculate_user_metrics(user_obj)
         
         # Store in node_data format for algorithm compatibility
-        self.node_data[user_obj.username] = {
-            "type": "user",
-            "post_count": len(user_obj.posts),
-            "total_views": user_metrics['total_views'],
-            "age": user_obj.age,
-            "gender": user_obj.gender,
-            "location": user_obj.region,
-            "comment_count": len(user_obj.comments_authored),
-            "reading_level": user_metrics['avg_reading_level'],
-            "user_obj": user_obj  # Keep reference to original object
-        }
+        user_data = UserAttrs(
+            post_count=len(user_obj.posts),
+            total_views=user_metrics['total_views'],
+            age=user_obj.age,
+            gender=user_obj.gender,
+            location=user_obj.region,
+            comment_count=len(user_obj.comments_authored),
+            reading_level=user_metrics['avg_reading_level'],
+            user_obj=user_obj
+        )
+        self.node_data[user_obj.username] = user_data
+        for attr, buckets in self._attr_index.items():
+            buckets.setdefault(getattr(user_data, attr), []).append(user_obj.username)
+        self._store_user_row(user_obj.username, user_data)
+        self._user_columns = None  # User columns are stale now
+        self._score_cache.clear()  # Cached scores may belong to the overwritten user or old columns
+        self._csr_stale = True
     
     def add_post(self, post_obj):
         """Add a Post object to the graph"""
@@ -46,34 +165,35 @@ class SocialGraph:
         post_metrics = self._calculate_post_metrics(post_obj)
         
         # Store in node_data format
-        self.node_data[post_obj.id] = {
-            "type": "post",
-            "view_count": len(post_obj.views),
-            "comment_count": len(post_obj.comments),
-            "reading_level": post_metrics['reading_level'],
-            "post_obj": post_obj
-        }
+        self.node_data[post_obj.id] = PostAttrs(
+            view_count=len(post_obj.views),
+            comment_count=len(post_obj.comments),
+            reading_level=post_metrics['reading_level'],
+            post_obj=post_obj
+        )
         
-        # Add authorship edge
-        self.add_edge(post_obj.author_username, post_obj.id, {"connection": "created"})
-        
-        # Add viewing edges
-        for viewer_username, _ in post_obj.views:
-            self.add_edge(viewer_username, post_obj.id, {"connection": "viewed"})
+        # Add the authorship edge and one viewing edge per view, extending the edge arrays in bulk
+        n_views = len(post_obj.views)
+        self._edge_src.append(post_obj.author_username)
+        self._edge_src.extend([viewer_username for viewer_username, _ in post_obj.views])
+        self._edge_tgt.extend([post_obj.id] * (n_views + 1))
+        self._edge_rel_code.append(_REL_CODES["created"])
+        self._edge_rel_code.extend(array("b", [_REL_CODES["viewed"]]) * n_views)
+        self._csr_stale = True
     
     def _calculate_user_metrics(self, user_obj):
-        """Calculate derived metrics for a user"""
+        """Calculate derived metrics for a user (reuses per-post values cached by add_post)"""
         total_views = sum(len(post.views) for post in user_obj.posts)
         
         # Calculate average reading level of user's posts
-        reading_levels = {"low": 1, "medium": 2, "high": 3}
         if user_obj.posts:
-            avg_reading_numeric = sum(reading_levels.get(self._estimate_reading_level(post.content), 2) 
-                                    for post in user_obj.posts) / len(user_obj.posts)
+            # Average is reading_total / n; compare 2 * total against 3n and 5n to bucket it at 1.5 and 2.5
+            reading_total = sum(self._post_reading_int(post) for post in user_obj.posts)
+            n = len(user_obj.posts)
             # Convert back to string
-            if avg_reading_numeric <= 1.5:
+            if 2 * reading_total <= 3 * n:
                 avg_reading_level = "low"
-            elif avg_reading_numeric <= 2.5:
+            elif 2 * reading_total <= 5 * n:
                 avg_reading_level = "medium"
             else:
                 avg_reading_level = "high"
@@ -86,19 +206,34 @@ class SocialGraph:
         }
     
     def _calculate_post_metrics(self, post_obj):
-        """Calculate derived metrics for a post"""
+        """Calculate derived metrics for a post (re-estimated on every add, in case the content changed)"""
         reading_level = self._estimate_reading_level(post_obj.content)
+        self._reading_by_post[post_obj.id] = _READING_LEVELS[reading_level]
         return {
             'reading_level': reading_level
         }
     
+    def _post_reading_int(self, post_obj):
+        """Reading level of a post as an int, reusing the value stored by add_post if there is one"""
+        reading_int = self._reading_by_post.get(post_obj.id)
+        if reading_int is None:
+            reading_int = _READING_LEVELS[self._estimate_reading_level(post_obj.content)]
+            self._reading_by_post[post_obj.id] = reading_int
+        return reading_int
+    
     def _estimate_reading_level(self, content):
         """Simple heuristic to estimate reading level based on content"""
         if not content:
             return "low"
         
-        words = content.split()
-        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
+        if content.isprintable() and "  " not in content and content[0] != " " and content[-1] != " ":
+            # Words separated by single spaces only (isprintable() rules out newlines, tabs and other
+            # whitespace): average word length from C-level string counts, without building a word list
+            n_spaces = content.count(" ")
+            avg_word_length = (len(content) - n_spaces) / (n_spaces + 1)
+        else:
+            words = content.split()
+            avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
         
         if avg_word_length > 6:
             return "high"
@@ -107,11 +242,158 @@ class SocialGraph:
         else:
             return "low"
     
+    def _store_user_row(self, username, user_data):
+        """Append the user's row to the column lists, or overwrite it if the user was added before"""
+        columns = (self._usernames, self._post_count, self._total_views, self._comment_count,
+                   self._reading_int, self._age, self._gender, self._location)
+        values = (username, user_data.post_count, user_data.total_views, user_data.comment_count,
+                  _READING_LEVELS.get(user_data.reading_level, _READING_DEFAULT),
+                  user_data.age, user_data.gender, user_data.location)
+        
+        row = self._username_index.get(username)
+        if row is None:
+            self._username_index[username] = len(self._usernames)
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(columns, values):
+                column[row] = value
+    
+    def _rebuild_user_columns(self):
+        """Convert the per-user column lists into NumPy arrays"""
+        user_ids = np.array(self._usernames, dtype=object)
+        id_rank = np.empty(len(user_ids), dtype=np.int64)  # Position of each user id in sorted order
+        id_rank[np.argsort(user_ids, kind="stable")] = np.arange(len(user_ids))
+        self._user_columns = {
+            "user_ids": user_ids,
+            "id_rank": id_rank,
+            "post_count": np.asarray(self._post_count, dtype=np.int32),
+            "total_views": np.asarray(self._total_views, dtype=np.int32),
+            "comment_count": np.asarray(self._comment_count, dtype=np.int32),
+            "reading_level_int": np.asarray(self._reading_int, dtype=np.int32),
+            "age": np.asarray(self._age, dtype=np.float64),  # Missing ages become NaN and never match
+            "gender": np.array(self._gender, dtype=object),
+            "location": np.array(self._location, dtype=object),
+        }
+    
+    def _user_column_max(self):
+        """Largest value of each score column over all users (0 if there are none), from the column lists"""
+        return {
+            "post_count": max(self._post_count, default=0),
+            "comment_count": max(self._comment_count, default=0),
+            "total_views": max(self._total_views, default=0),
+            "reading_level_int": max(self._reading_int, default=0),
+        }
+    
+    def user_columns(self):
+        """Return the NumPy user columns, rebuilding them if users were added since the last call"""
+        if self._user_columns is None:
+            self._rebuild_user_columns()
+        return self._user_columns
+    
+    def user_mask(self, attribute_filters):
+        """Boolean NumPy mask over the user columns, True for users matching every filter"""
+        cols = self.user_columns()
+        mask = np.ones(len(cols["user_ids"]), dtype=bool)
+        other_filters = {}
+        for attr, value in attribute_filters.items():
+            if attr == "age_min":
+                mask &= cols["age"] >= value
+            elif attr == "age_max":
+                mask &= cols["age"] <= value
+            elif attr == "reading_level":
+                mask &= cols["reading_level_int"] == _READING_LEVELS.get(value, 0)
+            elif attr in ("post_count", "total_views", "comment_count", "age", "gender", "location"):
+                mask &= cols[attr] == value
+            else:
+                other_filters[attr] = value
+        
+        # Attributes without a column are checked one user at a time, on the users still in the mask
+        if other_filters:
+            for row in np.flatnonzero(mask).tolist():
+                user_data = self.node_data[self._usernames[row]]
+                if any(getattr(user_data, attr, None) != value for attr, value in other_filters.items()):
+                    mask[row] = False
+        return mask
+    
+    def _cached_scores(self, criteria_key):
+        """Scores cached for a criteria key (marked as most recently used), or None"""
+        scores = self._score_cache.get(criteria_key)
+        if scores is not None:
+            self._score_cache.move_to_end(criteria_key)
+        return scores
+    
+    def _cache_scores(self, criteria_key, scores):
+        """Cache scores for a criteria key, evicting the least recently used beyond _SCORE_CACHE_SIZE"""
+        self._score_cache[criteria_key] = scores
+        self._score_cache.move_to_end(criteria_key)
+        if len(self._score_cache) > _SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+    
+    def iter_users(self):
+        """Yield (username, node_data) for every user, without visiting post nodes"""
+        node_data = self.node_data
+        for username in self.users:
+            yield username, node_data[username]
+    
+    def users_with_attribute(self, attr, value):
+        """Return ids of users whose attribute equals value, or None if attr is not indexed"""
+        buckets = self._attr_index.get(attr)
+        if buckets is None:
+            return None
+        return buckets.get(value, [])
+    
     def add_edge(self, source, target, relationship):
-        self.adjacency_list[source].append((target, relationship))
+        """Add a directed edge; relationship is a name such as "created" and is stored as its int code"""
+        self._edge_src.append(source)
+        self._edge_tgt.append(target)
+        self._edge_rel_code.append(_REL_CODES.get(relationship, -1))
+        self._csr_stale = True
+    
+    def iter_edges(self):
+        """Yield (source, target, rel_code) for every edge in insertion order"""
+        return zip(self._edge_src, self._edge_tgt, self._edge_rel_code)
+    
+    def finalize(self):
+        """Pack the edges into CSR arrays over contiguous int node indices (no-op if up to date)"""
+        if not self._csr_stale:
+            return
+        
+        node_ids = list(self.node_data)
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        degree = [0] * len(node_ids)
+        # Edges can mention nodes that were never added (e.g. a viewer outside the graph),
+        # which get indices at the end
+        for source, target in zip(self._edge_src, self._edge_tgt):
+            for node_id in (source, target):
+                if node_id not in node_index:
+                    node_index[node_id] = len(node_ids)
+                    node_ids.append(node_id)
+                    degree.append(0)
+            degree[node_index[source]] += 1
+        
+        indptr = array("i", [0])
+        for d in degree:
+            indptr.append(indptr[-1] + d)
+        targets = array("i", [0]) * indptr[-1]
+        rel_codes = array("b", [0]) * indptr[-1]
+        next_slot = indptr[:-1]  # Next free position in each node's edge range
+        for source, target, rel_code in self.iter_edges():
+            u = node_index[source]
+            j = next_slot[u]
+            targets[j] = node_index[target]
+            rel_codes[j] = rel_code
+            next_slot[u] = j + 1
+        
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.targets = targets
+        self.rel_codes = rel_codes
+        self._csr_stale = False
     
     def all_nodes(self):
-        return list(self.node_data.keys())
+        """Return a live view of the node ids (wrap in list() to snapshot or index it)"""
+        return self.node_data.keys()
     
     def node_attributes(self, node_id):
         return self.node_data.get(node_id)
@@ -130,13 +412,12 @@ def calculate_interest_score(user_data, criteria):
     
     # Post count scoring (high or low can be interesting)
     if criteria.get("post_count_preference") == "high":
-        score += user_data.get("post_count", 0) * criteria.get("post_weight", 1)
+        score += user_data.post_count * criteria.get("post_weight", 1)
     elif criteria.get("post_count_preference") == "low":
-        score += (20 - user_data.get("post_count", 0)) * criteria.get("post_weight", 1)
+        score += (20 - user_data.post_count) * criteria.get("post_weight", 1)
     
     # Reading level scoring
-    reading_levels = {"low": 1, "medium": 2, "high": 3}
-    user_reading = reading_levels.get(user_data.get("reading_level", "medium"), 2)
+    user_reading = _READING_LEVELS.get(user_data.reading_level, _READING_DEFAULT)
     if criteria.get("reading_level_preference") == "high":
         score += user_reading * criteria.get("reading_weight", 1)
     elif criteria.get("reading_level_preference") == "low":
@@ -144,68 +425,312 @@ def calculate_interest_score(user_data, criteria):
     
     # Comment activity scoring
     if criteria.get("comment_preference") == "high":
-        score += user_data.get("comment_count", 0) * criteria.get("comment_weight", 1)
+        score += user_data.comment_count * criteria.get("comment_weight", 1)
     elif criteria.get("comment_preference") == "low":
-        score += (100 - user_data.get("comment_count", 0)) * criteria.get("comment_weight", 1)
+        score += (100 - user_data.comment_count) * criteria.get("comment_weight", 1)
     
     # View activity scoring
-    score += user_data.get("total_views", 0) * criteria.get("view_weight", 0.1)
+    score += user_data.total_views * criteria.get("view_weight", 0.1)
     
     return max(0, score)
 
+# Specialize calculate_interest_score for one criteria dict: read every setting once and return one
+# straight-line closure. For scoring many users, build it once with scorer = make_scorer(criteria) and
+# call scorer(user_data) for each user.
+def make_scorer(criteria):
+    # Each preference term is (offset + sign * x) * weight: x * w for "high", (cap - x) * w for "low"
+    # and 0 when the preference is unset, so one closure covers every combination of preferences
+    def term(pref_key, weight_key, cap):
+        pref = criteria.get(pref_key)
+        if pref == "high":
+            return 0, 1, criteria.get(weight_key, 1)
+        elif pref == "low":
+            return cap, -1, criteria.get(weight_key, 1)
+        return 0, 0, 0
+    
+    post_off, post_sign, post_w = term("post_count_preference", "post_weight", 20)
+    read_off, read_sign, read_w = term("reading_level_preference", "reading_weight", 4)
+    comm_off, comm_sign, comm_w = term("comment_preference", "comment_weight", 100)
+    view_w = criteria.get("view_weight", 0.1)
+    
+    def score(ud):
+        # Terms are added in the same order as calculate_interest_score, so float results match it
+        total = ((post_off + post_sign * ud.post_count) * post_w
+                 + (read_off + read_sign * _READING_LEVELS.get(ud.reading_level, _READING_DEFAULT)) * read_w
+                 + (comm_off + comm_sign * ud.comment_count) * comm_w
+                 + ud.total_views * view_w)
+        return max(0, total)
+    
+    return score
+
+# Weight from criteria as an integer number of 1 / _SCORE_SCALE units, or None if it is not a
+# whole number of units (rounding it would change the scores)
+def _fixed_point_weight(criteria, key, default):
+    scaled = criteria.get(key, default) * _SCORE_SCALE
+    if not math.isfinite(scaled) or not math.isclose(scaled, round(scaled), rel_tol=1e-9):
+        return None
+    return int(round(scaled))
+
+# Fixed-point score as const + sum(coef * column): "high" adds w * x, "low" turns (cap - x) * w
+# into cap * w - w * x, so the kernel needs no per-user branches. column_max maps each score column
+# to its largest value over all users, which bounds the scores.
+# Returns None if a weight in use has no exact fixed-point value or a score could overflow int32.
+def _linear_score_terms(criteria, column_max):
+    const = 0
+    bound = 0  # Largest possible |score| (and partial sum) in fixed-point units
+    coefs = []
+    for pref_key, weight_key, default, column, cap in (
+            ("post_count_preference", "post_weight", 1, "post_count", 20),
+            ("comment_preference", "comment_weight", 1, "comment_count", 100),
+            ("reading_level_preference", "reading_weight", 1, "reading_level_int", 4),
+            (None, "view_weight", 0.1, "total_views", 0)):  # Views always count, like a "high" preference
+        pref = _PREF_CODES.get(criteria.get(pref_key), 0) if pref_key else 1
+        if pref == 0:
+            coefs.append(0)
+            continue
+        weight = _fixed_point_weight(criteria, weight_key, default)
+        if weight is None or abs(weight) > _INT32_MAX:
+            return None
+        coefs.append(pref * weight)
+        if pref == -1:
+            const += cap * weight
+        bound += abs(weight) * ((cap if pref == -1 else 0) + column_max[column])
+    if bound > _INT32_MAX:
+        return None
+    post_coef, comm_coef, read_coef, view_coef = coefs
+    return post_coef, comm_coef, view_coef, read_coef, const
+
+# Unclamped fixed-point score from _linear_score_terms; works on one user's ints or on whole int32
+# NumPy columns (the bound checked there keeps every partial sum within int32)
+def _fixed_point_score(terms, post_count, comment_count, total_views, reading):
+    post_coef, comm_coef, view_coef, read_coef, const = terms
+    return (const + post_coef * post_count + read_coef * reading
+            + comm_coef * comment_count + view_coef * total_views)
+
+# Vectorized version of calculate_interest_score over every user at once (needs NumPy).
+# Returns (scores, scale) with each user's score equal to scores / scale: int32 fixed-point scores
+# with scale _SCORE_SCALE when the weights allow it, otherwise float64 scores with scale 1.
+# Fixed point rounds nothing away, but scores the float formula leaves a rounding error apart
+# (7.7 and 7.699999999999999) come out as exact ties, so ranks can differ from sorting the float scores.
+def calculate_interest_scores(user_cols, criteria):
+    column_max = {column: int(user_cols[column].max(initial=0)) for column in _SCORE_COLUMNS}
+    terms = _linear_score_terms(criteria, column_max)
+    if terms is None:
+        return _float_interest_scores(user_cols, criteria), 1
+    
+    n = len(user_cols["user_ids"])
+    score_kernel = _score_kernel() if _HAS_NUMBA and n >= _NUMBA_MIN_USERS else None
+    if score_kernel is not None:
+        score = np.empty(n, dtype=np.int32)
+        score_kernel(user_cols["post_count"], user_cols["comment_count"], user_cols["total_views"],
+                     user_cols["reading_level_int"], *terms, score)
+        return score, _SCORE_SCALE
+    
+    score = _fixed_point_score(terms, user_cols["post_count"], user_cols["comment_count"],
+                               user_cols["total_views"], user_cols["reading_level_int"])
+    np.maximum(score, 0, out=score)
+    return score, _SCORE_SCALE
+
+# calculate_interest_score over every user in float64, for criteria the fixed-point scorers can't
+# represent exactly (terms are added in the same order, so the scores match it)
+def _float_interest_scores(user_cols, criteria):
+    score = np.zeros(len(user_cols["user_ids"]), dtype=np.float64)
+    
+    # Post count scoring
+    post_w = float(criteria.get("post_weight", 1))
+    if criteria.get("post_count_preference") == "high":
+        score += user_cols["post_count"] * post_w
+    elif criteria.get("post_count_preference") == "low":
+        score += (20 - user_cols["post_count"]) * post_w
+    
+    # Reading level scoring
+    read_w = float(criteria.get("reading_weight", 1))
+    if criteria.get("reading_level_preference") == "high":
+        score += user_cols["reading_level_int"] * read_w
+    elif criteria.get("reading_level_preference") == "low":
+        score += (4 - user_cols["reading_level_int"]) * read_w
+    
+    # Comment activity scoring
+    comm_w = float(criteria.get("comment_weight", 1))
+    if criteria.get("comment_preference") == "high":
+        score += user_cols["comment_count"] * comm_w
+    elif criteria.get("comment_preference") == "low":
+        score += (100 - user_cols["comment_count"]) * comm_w
+    
+    # View activity scoring
+    score += user_cols["total_views"] * float(criteria.get("view_weight", 0.1))
+    
+    np.maximum(score, 0, out=score)
+    return score
+
+_compiled_score_kernel = None
+
+def _score_kernel():
+    """Return the Numba scoring kernel, compiling it on first use, or None if Numba can't be imported"""
+    global _compiled_score_kernel, _HAS_NUMBA
+    if _compiled_score_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:  # Not installed, or installed but unusable (e.g. built for another NumPy)
+            _HAS_NUMBA = False
+            return None
+        
+        # Each user's score depends only on its own row, so rows are split across cores with prange.
+        # The explicit signature compiles it once; cache=True keeps the machine code on disk.
+        @njit("void(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, int64, int64, int32[:])",
+              parallel=True, cache=True)
+        def score_rows(post_count, comment_count, total_views, reading,
+                       post_coef, comm_coef, view_coef, read_coef, const, out):
+            for i in prange(post_count.shape[0]):
+                s = (const + post_coef * post_count[i] + read_coef * reading[i]
+                     + comm_coef * comment_count[i] + view_coef * total_views[i])
+                out[i] = s if s > 0 else 0
+        
+        _compiled_score_kernel = score_rows
+    return _compiled_score_kernel
+
 # Attribute filtering system
 def filter_users_by_attributes(network, attribute_filters):
-    filtered_users = []
+    if np is not None:
+        # One boolean mask over the user columns (which hold only users, so no type check)
+        user_ids = network.user_columns()["user_ids"]
+        rows = np.nonzero(network.user_mask(attribute_filters))[0]
+        return [(user_id, network.node_data[user_id]) for user_id in user_ids[rows].tolist()]
+    
+    # Answer equality filters on indexed attributes from the index, starting from the smallest bucket
+    buckets = []
+    other_filters = {}
+    for attr, value in attribute_filters.items():
+        bucket = network.users_with_attribute(attr, value) if attr not in ["age_min", "age_max"] else None
+        if bucket is None:
+            other_filters[attr] = value
+        else:
+            buckets.append(bucket)
     
-    for node_id in network.all_nodes():
-        node_data = network.node_attributes(node_id)
-        if node_data and node_data.get("type") == "user":
-            matches_all_filters = True
-            
-            # Check each attribute filter
-            for attr, value in attribute_filters.items():
-                if attr == "age_min" and node_data.get("age", 0) < value:
-                    matches_all_filters = False
-                    break
-                elif attr == "age_max" and node_data.get("age", 100) > value:
-                    matches_all_filters = False
-                    break
-                elif attr not in ["age_min", "age_max"] and node_data.get(attr) != value:
-                    matches_all_filters = False
-                    break
-            
-            if matches_all_filters:
-                filtered_users.append((node_id, node_data))
+    if buckets:
+        buckets.sort(key=len)
+        other_buckets = [set(bucket) for bucket in buckets[1:]]
+        candidates = [(user_id, network.node_data[user_id]) for user_id in buckets[0]
+                      if all(user_id in bucket for bucket in other_buckets)]
+    else:
+        candidates = network.iter_users()
+    
+    # Check the remaining filters on the (usually much smaller) candidate list
+    filtered_users = []
+    for node_id, node_data in candidates:
+        matches_all_filters = True
+        
+        for attr, value in other_filters.items():
+            if attr == "age_min" and node_data.age < value:
+                matches_all_filters = False
+                break
+            elif attr == "age_max" and node_data.age > value:
+                matches_all_filters = False
+                break
+            elif attr not in ["age_min", "age_max"] and getattr(node_data, attr, None) != value:
+                matches_all_filters = False
+                break
+        
+        if matches_all_filters:
+            filtered_users.append((node_id, node_data))
     
     return filtered_users
 
 # Interactive analysis function
 def find_interesting_users_interactive(network, criteria, attribute_filters=None, num_users=3):
+    if num_users <= 0:
+        return []
+    
+    if np is not None:
+        user_cols = network.user_columns()
+        user_ids = user_cols["user_ids"]
+        # Filter by attributes with one boolean mask over the user columns
+        if attribute_filters:
+            positions = np.flatnonzero(network.user_mask(attribute_filters))
+        else:
+            positions = np.arange(len(user_ids))
+        if positions.size == 0:
+            return []
+        
+        k = min(num_users, positions.size)
+        
+        # Score every user in one vectorized or compiled pass (or reuse the scores from an
+        # earlier call with the same criteria), then pick the top candidates
+        criteria_key = frozenset(criteria.items())
+        cached = network._cached_scores(criteria_key)
+        if cached is None:
+            cached = calculate_interest_scores(user_cols, criteria)
+            network._cache_scores(criteria_key, cached)
+        all_scores, scale = cached
+        scores = all_scores[positions]
+        id_rank = user_cols["id_rank"][positions]
+        
+        # Rank by score, then by user id, like the pure-Python path
+        if k < scores.size // 4:
+            # Small k: O(n) partition to find the k-th best score, then sort only the users scoring
+            # at least that much (every user tied with the k-th is kept so ties resolve by id)
+            kth_score = np.partition(scores, scores.size - k)[scores.size - k]
+            top = np.flatnonzero(scores >= kth_score)
+            top = top[np.lexsort((id_rank[top], -scores[top]))][:k]
+        else:
+            # Large k: partitioning saves little over one full sort
+            top = np.lexsort((id_rank, -scores))[:k]
+        top_scores = scores[top]
+        
+        return [{
+            "user_id": user_ids[row],
+            "score": score / scale,
+            "data": network.node_data[user_ids[row]]
+        } for row, score in zip(positions[top].tolist(), top_scores.tolist())]
+    
     # First filter by attributes if specified
     if attribute_filters:
         candidate_users = filter_users_by_attributes(network, attribute_filters)
     else:
-        candidate_users = [(node_id, network.node_attributes(node_id)) 
-                          for node_id in network.all_nodes() 
-                          if network.node_attributes(node_id).get("type") == "user"]
-    
-    user_scores = []
-    
-    # Calculate scores for filtered users
-    for user_id, user_data in candidate_users:
-        interest_score = calculate_interest_score(user_data, criteria)
-        heapq.heappush(user_scores, (-interest_score, user_id, user_data))
+        candidate_users = list(network.iter_users())
+    
+    if not candidate_users:
+        return []
+    
+    # Calculate scores for filtered users, reusing scores cached for the same criteria
+    criteria_key = frozenset(criteria.items())
+    cached = network._cached_scores(criteria_key)
+    if cached is None:
+        # Same arithmetic as calculate_interest_scores: fixed point when the weights allow it, else float
+        terms = _linear_score_terms(criteria, network._user_column_max())
+        if terms is None:
+            scorer, scale = make_scorer(criteria), 1
+        else:
+            def scorer(ud):
+                reading = _READING_LEVELS.get(ud.reading_level, _READING_DEFAULT)
+                return max(0, _fixed_point_score(terms, ud.post_count, ud.comment_count, ud.total_views, reading))
+            scale = _SCORE_SCALE
+        cached = ({}, scorer, scale)  # user_id -> score, filled in as users are scored
+        network._cache_scores(criteria_key, cached)
+    score_cache, scorer, scale = cached
+    
+    def scored_users():
+        for user_id, user_data in candidate_users:
+            interest_score = score_cache.get(user_id)
+            if interest_score is None:
+                interest_score = score_cache[user_id] = scorer(user_data)
+            yield interest_score, user_id, user_data
+    
+    if num_users >= len(candidate_users) // 2:
+        # Keeping half or more of the candidates: one full sort beats heap maintenance
+        ranked = sorted(scored_users(), key=lambda t: (-t[0], t[1]))[:num_users]
+    else:
+        # Keep only the best num_users in a bounded heap; ties at the cut-off go to the smallest user id
+        ranked = heapq.nsmallest(num_users, scored_users(), key=lambda t: (-t[0], t[1]))
     
-    # Get top users
+    # Get top users, highest score first
     interesting_users = []
-    for _ in range(min(num_users, len(user_scores))):
-        if user_scores:
-            neg_score, user_id, user_data = heapq.heappop(user_scores)
-            interesting_users.append({
-                "user_id": user_id,
-                "score": -neg_score,
-                "data": user_data
-            })
+    for interest_score, user_id, user_data in ranked:
+        interesting_users.append({
+            "user_id": user_id,
+            "score": interest_score / scale,
+            "data": user_data
+        })
     
     return interesting_users
 
@@ -302,36 +827,42 @@ def generate_visualization_data(network, interesting_users):
     edges = []
     
     # Add all nodes with highlighting for interesting users
-    interesting_ids = [user["user_id"] for user in interesting_users]
-    max_score = max([user["score"] for user in interesting_users]) if interesting_users else 1
+    score_by_id = {user["user_id"]: user["score"] for user in interesting_users}
+    max_score = max(score_by_id.values(), default=1)
     
-    for node_id in network.all_nodes():
-        node_data = network.node_attributes(node_id)
-        is_interesting = node_id in interesting_ids
+    for node_id, node_data in network.node_data.items():
+        user_score = score_by_id.get(node_id)
+        is_interesting = user_score is not None
         
         if is_interesting:
-            user_score = next(user["score"] for user in interesting_users if user["user_id"] == node_id)
             node_size = 10 + (user_score / max_score) * 20  # Scale size by score
+            node_color = _HIGHLIGHT_COLOR
         else:
-            node_size = 5 if node_data.get("type") == "post" else 8
+            node_size = node_data._base_size
+            node_color = node_data._base_color
         
         nodes.append({
             "id": node_id,
-            "type": node_data.get("type", "unknown"),
+            "type": node_data.type,
             "size": node_size,
-            "color": "#FF6B6B" if is_interesting else ("#4ECDC4" if node_data.get("type") == "user" else "#45B7D1"),
+            "color": node_color,
             "highlighted": is_interesting,
             "attributes": node_data
         })
     
-    # Add edges
-    for source_id in network.all_nodes():
-        for target_id, edge_data in network.adjacency_list[source_id]:
+    # Add edges by scanning the CSR arrays. Only sources that are nodes are visited: finalize() puts
+    # ids it saw only in edges after the nodes, and their edges are left out as before.
+    network.finalize()
+    node_ids, indptr, targets, rel_codes = network.node_ids, network.indptr, network.targets, network.rel_codes
+    for u in range(len(network.node_data)):
+        source_id = node_ids[u]
+        for j in range(indptr[u], indptr[u + 1]):
+            relationship = _REL_NAMES[rel_codes[j]]
             edges.append({
                 "source": source_id,
-                "target": target_id,
-                "relationship": edge_data.get("connection", "unknown"),
-                "color": "#FF6B6B" if edge_data.get("connection") == "created" else "#DDD"
+                "target": node_ids[targets[j]],
+                "relationship": relationship,
+                "color": _EDGE_COLOR.get(relationship, _DEFAULT_EDGE_COLOR)
             })
     
     return {"nodes": nodes, "edges": edges, "highlighted_users": interesting_users}
@@ -346,12 +877,12 @@ if __name__ == "__main__":
     # Initialize the social graph
     network = SocialGraph()
     
-    # Add all users to the graph
+    # Add all posts first so their reading levels are cached, then the users whose metrics use them
     for user in users:
-        network.add_user(user)
-        # Add all posts from this user
         for post in user.posts:
             network.add_post(post)
+    for user in users:
+        network.add_user(user)
     
     print(f"Network created with {len(network.users)} users and {len(network.posts)} posts")
     print(f"Total nodes: {len(network.all_nodes())}")
@@ -367,7 +898,7 @@ if __name__ == "__main__":
     for i, user in enumerate(high_posters, 1):
         user_obj = network.users[user['user_id']]
         print(f"{i}. {user_obj.real_name} (@{user['user_id']}) - Score: {user['score']:.1f}")
-        print(f"   Posts: {user['data']['post_count']}, Views: {user['data']['total_views']}")
+        print(f"   Posts: {user['data'].post_count}, Views: {user['data'].total_views}")
     
     # Example 2: Find female users with high reading levels (as requested in requirements)
     print("\n=== Example 2: Female Users with High Reading Levels ===")
@@ -382,8 +913,8 @@ if __name__ == "__main__":
     for i, user in enumerate(female_readers, 1):
         user_obj = network.users[user['user_id']]
         print(f"{i}. {user_obj.real_name} (@{user['user_id']}) - Score: {user['score']:.1f}")
-        print(f"   Gender: {user['data']['gender']}, Reading Level: {user['data']['reading_level']}")
-        print(f"   Comments: {user['data']['comment_count']}, Location: {user['data']['location']}")
+        print(f"   Gender: {user['data'].gender}, Reading Level: {user['data'].reading_level}")
+        print(f"   Comments: {user['data'].comment_count}, Location: {user['data'].location}")
     
     # Example 3: Find Seoul users aged 24-26 with high activity
     print("\n=== Example 3: Seoul Users (24-26) with High Activity ===")
@@ -399,8 +930,8 @@ if __name__ == "__main__":
     for i, user in enumerate(seoul_active, 1):
         user_obj = network.users[user['user_id']]
         print(f"{i}. {user_obj.real_name} (@{user['user_id']}) - Score: {user['score']:.1f}")
-        print(f"   Age: {user_obj.age}, Location: {user['data']['location']}")
-        print(f"   Posts: {user['data']['post_count']}, Comments: {user['data']['comment_count']}")
+        print(f"   Age: {user_obj.age}, Location: {user['data'].location}")
+        print(f"   Posts: {user['data'].post_count}, Comments: {user['data'].comment_count}")
     
     # Example 4: Find users with low activity (potentially new or inactive users)
     print("\n=== Example 4: Low Activity Users (New/Inactive Users) ===")
@@ -414,7 +945,7 @@ if __name__ == "__main__":
     for i, user in enumerate(low_activity, 1):
         user_obj = network.users[user['user_id']]
         print(f"{i}. {user_obj.real_name} (@{user['user_id']}) - Score: {user['score']:.1f}")
-        print(f"   Posts: {user['data']['post_count']}, Comments: {user['data']['comment_count']}")
+        print(f"   Posts: {user['data'].post_count}, Comments: {user['data'].comment_count}")
     
     # Example 5: Multi-criteria analysis - Female users from Seoul with high engagement
     print("\n=== Example 5: Female Seoul Users with High Engagement ===")
@@ -432,6 +963,6 @@ if __name__ == "__main__":
     for i, user in enumerate(female_seoul_engaged, 1):
         user_obj = network.users[user['user_id']]
         print(f"{i}. {user_obj.real_name} (@{user['user_id']}) - Score: {user['score']:.1f}")
-        print(f"   Gender: {user['data']['gender']}, Location: {user['data']['location']}")
-        print(f"   Posts: {user['data']['post_count']}, Comments: {user['data']['comment_count']}, Reading Level: {user['data']['reading_level']}")
+        print(f"   Gender: {user['data'].gender}, Location: {user['data'].location}")
+        print(f"   Posts: {user['data'].post_count}, Comments: {user['data'].comment_count}, Reading Level: {user['data'].reading_level}")
     
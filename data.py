@@ -4,6 +4,9 @@ from datetime import datetime
 # --- Comment Class ---
 # Each comment has an ID, author, text content, and a timestamp.
 class Comment:
+    # Fixed attribute list: no per-object __dict__, so each comment is smaller and faster to read
+    __slots__ = ("id", "author_username", "content", "timestamp", "author")
+
     def __init__(self, comment_id, author_username, content, timestamp=None):
         self.id = comment_id  # Unique ID for each comment so we can tell them apart
         self.author_username = author_username  # The username of the person who made the comment
@@ -14,6 +17,9 @@ class Comment:
 # --- Post Class ---
 # Represents one post someone makes. Can have comments and track who viewed it.
 class Post:
+    # Fixed attribute list, same as Comment
+    __slots__ = ("id", "author_username", "content", "timestamp", "comments", "views", "author")
+
     def __init__(self, post_id, author_username, content, timestamp=None):
         self.id = post_id  # Unique ID for the post
         self.author_username = author_username  # Who posted it
@@ -36,6 +42,10 @@ class Post:
 # --- User Class ---
 # Represents one person in the social network.
 class User:
+    # Fixed attribute list, same as Comment
+    __slots__ = ("username", "real_name", "age", "gender", "region",
+                 "connections", "posts", "viewed_posts", "comments_authored")
+
     def __init__(self, username, real_name=None, age=None, gender=None, region=None):
         self.username = username  # Unique ID for the user (@handle)
         self.real_name = real_name  # Optional: full name
@@ -43,15 +53,15 @@ class User:
         self.gender = gender  # Optional: gender
         self.region = region  # Optional: where they’re from
 
-        # These are all lists that help track what this user does:
-        self.connections = []  # Who they’re connected to (like friends/followers), stored as (type, username)
+        # These all help track what this user does:
+        self.connections = set()  # Who they’re connected to (like friends/followers), stored as (type, username)
         self.posts = []  # Posts they made
-        self.viewed_posts = []  # Posts they’ve looked at
+        self.viewed_posts = set()  # Posts they’ve looked at (a set, so "did they see this one?" is quick)
         self.comments_authored = []  # Comments they’ve written
 
     # Connect this user to another one — like sending a friend request
     def connect_user(self, target_username, relationship_type):
-        self.connections.append((relationship_type, target_username))
+        self.connections.add((relationship_type, target_username))
 
     # Let this user make a new post
     def make_post(self, post_id, content, timestamp=None):
@@ -62,7 +72,7 @@ class User:
 
     # Simulate this user looking at a post (like scrolling past it or clicking it)
     def view_a_post(self, post_obj, timestamp=None):
-        self.viewed_posts.append(post_obj)  # Track it in the user's profile
+        self.viewed_posts.add(post_obj)  # Track it in the user's profile
         post_obj.add_view(self.username, timestamp)  # And also mark the view on the post side
 
     # Simulate writing a comment on someone’s post.
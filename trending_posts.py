@@ -1,5 +1,6 @@
 import json
 import heapq
+import re
 from datetime import datetime
 
 # Load social media data from JSON
@@ -23,40 +24,62 @@ def compute_trending_score(post):
     if len(views) < 2:
         return 0.0 
 
-    views_sorted = sorted(views, key=lambda x: datetime.fromisoformat(x["timestamp"]))
-    start_time = datetime.fromisoformat(views_sorted[0]["timestamp"])
-    end_time = datetime.fromisoformat(views_sorted[-1]["timestamp"])
-
-    start_count = views_sorted[0]["count"]
-    end_count = views_sorted[-1]["count"]
+    # Single pass for the earliest and latest view. Each timestamp is parsed the first time its post
+    # is scored and kept on the view as "_ts", so scoring the corpus again doesn't re-parse it
+    start_time = end_time = None
+    for view in views:
+        t = view.get("_ts")
+        if t is None:
+            t = view["_ts"] = datetime.fromisoformat(view["timestamp"])
+        if start_time is None or t < start_time:
+            start_time, start_count = t, view["count"]
+        if end_time is None or t >= end_time:  # >= keeps the last of equal timestamps, as the sort did
+            end_time, end_count = t, view["count"]
 
     hours = (end_time - start_time).total_seconds() / 3600
     return (end_count - start_count) / hours if hours > 0 else 0
 
 def filter_users(users, filters):
+    # Snapshot the filters once instead of building a new items() view per user
+    criteria = tuple(filters.items())
+    if not criteria:
+        return list(users)
     return [
         user for user in users
-        if all(user.get(attr) == val for attr, val in filters.items())
+        if all(user.get(attr) == val for attr, val in criteria)
     ]
 
+def keyword_pattern(keywords):
+    """
+    One case-insensitive regex that finds any of the keywords as a substring,
+    or None if there are no keywords.
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
 def filter_posts(users, include_keywords, exclude_keywords):
+    # Compile the keyword sets once; each post is then scanned by a single C-level search
+    include_re = keyword_pattern(include_keywords)
+    exclude_re = keyword_pattern(exclude_keywords)
     posts = []
     for user in users:
         for post in user.get("posts", []):
-            text = post["content"].lower()
-            if include_keywords and not any(word in text for word in include_keywords):
+            text = post["content"]
+            if include_re and not include_re.search(text):
                 continue
-            if exclude_keywords and any(word in text for word in exclude_keywords):
+            if exclude_re and exclude_re.search(text):
                 continue
             posts.append(post)
     return posts
 
 def get_trending_posts(posts, k):
-    heap = []
-    for p in posts:
-        score = compute_trending_score(p)
-        heapq.heappush(heap, (-score, p["id"], p))
-    trending = [heapq.heappop(heap)[2] for _ in range(min(k, len(heap)))]
+    if k <= 0:
+        return []
+    # Keep only the k best posts in a bounded heap; ties go to the smallest post id
+    heap = heapq.nsmallest(k, ((compute_trending_score(p), p["id"], p) for p in posts),
+                           key=lambda item: (-item[0], item[1]))
+    trending = [item[2] for item in heap]
     return trending
 
 
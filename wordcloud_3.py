@@ -52,7 +52,7 @@ for i, post in enumerate(posts_sorted, 1):
 
 # --- 3. Word Cloud Visualization ---
 print("\n--- Word Cloud of Post Content ---")
-all_text = " ".join([post.content for post in posts])
+all_text = " ".join(post.content for post in posts)
 
 # Create and display the word cloud
 wordcloud = WordCloud(width=800, height=400, background_color='white').generate(all_text)